@@ -0,0 +1,706 @@
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+
+from app import get_full_quran, get_quran_info
+
+# Yerel veri dizini / Local data directory
+QURAN_DATA_DIR = os.environ.get(
+    "QURAN_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+)
+EDITIONS_DIR = os.path.join(QURAN_DATA_DIR, "editions")
+INDEX_DIR = os.path.join(QURAN_DATA_DIR, "index")
+INFO_PATH = os.path.join(QURAN_DATA_DIR, "info.json")
+
+# Dizin biçimi değiştiğinde artırılır / Bumped whenever the index layout changes
+INDEX_VERSION = 2
+
+# Dizin dosyasına sırayla yazılan diziler / Arrays written to the index file in order
+_ARRAY_FIELDS = (
+    "token_ids", "frequencies", "posting_offsets", "postings", "verse_offsets",
+    "verse_chapter", "verse_number", "verse_juz", "chapter_offsets",
+)
+
+# Sürüm adı ve yazı tipi yalnızca bu karakterleri içerebilir / Allowed edition and script names
+_EDITION_PATTERN = re.compile(r"^[a-z0-9-]+$")
+
+# Harekeler atıldıktan sonra birleştirilen Arapça harf varyantları / Arabic letter variants folded after diacritics are stripped
+_ARABIC_FOLDING = str.maketrans({
+    "\u0671": "\u0627",  # ٱ elif-i vasl / alef wasla -> ا
+    "\u0649": "\u064a",  # ى elif maksure / alef maksura -> ي
+    "\u0629": "\u0647",  # ة te merbuta / teh marbuta -> ه
+    "\u0640": "",         # ـ tatvil / tatweel
+})
+
+# Bellekteki sürüm dizinleri / In-memory edition segments
+_segments = {}
+_verse_juz = None
+
+
+def _edition_key(edition_name: str, script_type: str = ""):
+    """
+    Sürüm anahtarını oluşturur; geçersiz adlar dosya sistemine ulaşmadan reddedilir.
+    Builds the edition key; invalid names are rejected before touching the filesystem.
+
+    Returns / Dönüş:
+        tuple: (anahtar, None) veya (None, hata) / (key, None) or (None, error)
+    """
+    if not _EDITION_PATTERN.match(edition_name or ""):
+        return None, {"error": "Invalid edition name. Use lowercase letters, digits and '-' only."}
+    if script_type and not _EDITION_PATTERN.match(script_type):
+        return None, {"error": "Invalid script type. Use lowercase letters, digits and '-' only."}
+    return (f"{edition_name}-{script_type}" if script_type else edition_name), None
+
+
+def _index_path(edition_key: str):
+    return os.path.join(INDEX_DIR, f"{edition_key}.idx")
+
+
+def _edition_path(edition_key: str):
+    return os.path.join(EDITIONS_DIR, f"{edition_key}.json")
+
+
+def _atomic_write(path: str, write):
+    """
+    write(f) ile dosyayı geçici bir ada yazar ve os.replace ile yerine taşır.
+    Writes the file under a temporary name via write(f) and moves it into place with os.replace.
+
+    Yarıda kalan bir yazma asla eksik bir dosya bırakmaz.
+    An interrupted write never leaves a truncated file behind.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_json(path: str, data):
+    _atomic_write(path, lambda f: f.write(json.dumps(data, ensure_ascii=False).encode("utf-8")))
+
+
+def _read_json(path: str):
+    """
+    JSON dosyasını okur; dosya yoksa ya da bozuksa None döner.
+    Reads a JSON file; returns None if it is missing or corrupt.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _read_edition(edition_key: str):
+    """
+    Yerel sürüm dosyasındaki ayetleri okur; dosya yoksa ya da bozuksa None döner.
+    Reads the verses of a locally stored edition; returns None if it is missing or corrupt.
+    """
+    data = _read_json(_edition_path(edition_key))
+    if not isinstance(data, dict) or not isinstance(data.get("quran"), list):
+        return None
+    return data["quran"]
+
+
+def normalize_word(word: str):
+    """
+    Bir kelimeyi dizin anahtarına dönüştürür (harekeler, noktalama ve büyük harfler atılır).
+    Converts a word to its index key (diacritics, punctuation and case are dropped).
+
+    Arapça'da ٱ/أ/إ/آ -> ا, ى -> ي ve ة -> ه olarak birleştirilir.
+    Arabic ٱ/أ/إ/آ fold to ا, ى to ي and ة to ه.
+
+    Örnek / Example:
+        >>> normalize_word("Rahmân,")
+        'rahman'
+        >>> normalize_word("ٱللَّهِ")
+        'الله'
+    """
+    decomposed = unicodedata.normalize("NFKD", word).translate(_ARABIC_FOLDING)
+    return "".join(
+        ch for ch in decomposed
+        if ch.isalnum() and not unicodedata.combining(ch)
+    ).casefold()
+
+
+def _surface_words(text: str):
+    return [w for w in text.split() if normalize_word(w)]
+
+
+def _verse_juz_mapping(info):
+    mapping = {}
+    if not isinstance(info, dict):
+        return mapping
+    for chapter in info.get("chapters") or []:
+        for verse in chapter.get("verses") or []:
+            if chapter.get("chapter") and verse.get("verse") and verse.get("juz"):
+                mapping[(chapter["chapter"], verse["verse"])] = verse["juz"]
+    return mapping
+
+
+def _load_verse_juz():
+    """
+    Ayet -> cüz eşlemesini yerel info.json dosyasından yükler; dosya yoksa,
+    bozuksa ya da cüz verisi içermiyorsa API'den yeniden alır.
+    Loads the verse -> juz mapping from the local info.json, re-fetching it from
+    the API if the file is missing, corrupt or has no juz data.
+
+    Yalnızca boş olmayan bir eşleme önbelleğe alınır ve diske yazılır.
+    Only a non-empty mapping is cached and written to disk.
+    """
+    global _verse_juz
+    if _verse_juz:
+        return _verse_juz
+
+    mapping = _verse_juz_mapping(_read_json(INFO_PATH))
+    if not mapping:
+        info = get_quran_info()
+        mapping = _verse_juz_mapping(info)
+        if not mapping:
+            return {}
+        _write_json(INFO_PATH, info)
+
+    _verse_juz = mapping
+    return _verse_juz
+
+
+def _build_segment(edition_key: str, verses: list):
+    """
+    Tek bir sürüm için sıkıştırılmış dizin parçası oluşturur.
+    Builds the compact index segment for a single edition.
+
+    Kelimeler ayet sırasıyla tek bir akışta (token_ids) tutulur; her kelimenin
+    geçtiği yerler CSR düzeninde (posting_offsets + postings) akış konumları olarak saklanır.
+    Tokens are kept as one stream in verse order (token_ids); each token's
+    occurrences are stored CSR-style (posting_offsets + postings) as stream offsets.
+    """
+    juz_map = _load_verse_juz()
+    if not juz_map:
+        raise ValueError("Juz data could not be retrieved from Quran info, so the edition was not indexed.")
+    verses = sorted(verses, key=lambda v: (v["chapter"], v["verse"]))
+
+    vocab = {}
+    token_ids = array("I")
+    verse_offsets = array("I", [0])
+    verse_chapter = array("H")
+    verse_number = array("H")
+    verse_juz = array("B")
+    texts = []
+
+    for verse in verses:
+        for word in _surface_words(verse["text"]):
+            token_ids.append(vocab.setdefault(normalize_word(word), len(vocab)))
+        verse_offsets.append(len(token_ids))
+        verse_chapter.append(verse["chapter"])
+        verse_number.append(verse["verse"])
+        verse_juz.append(juz_map.get((verse["chapter"], verse["verse"]), 0))
+        texts.append(verse["text"])
+
+    frequencies = array("I", bytes(4 * len(vocab)))
+    for token_id in token_ids:
+        frequencies[token_id] += 1
+
+    posting_offsets = array("I", [0])
+    for count in frequencies:
+        posting_offsets.append(posting_offsets[-1] + count)
+
+    postings = array("I", bytes(4 * len(token_ids)))
+    cursor = array("I", posting_offsets[:-1])
+    for offset, token_id in enumerate(token_ids):
+        postings[cursor[token_id]] = offset
+        cursor[token_id] += 1
+
+    # chapter_offsets[c] sure c'nin ilk ayet indeksidir / first verse index of surah c
+    chapter_offsets = array("I", (bisect_left(verse_chapter, c) for c in range(116)))
+
+    return {
+        "version": INDEX_VERSION,
+        "edition": edition_key,
+        "vocab": list(vocab),
+        "token_ids": token_ids,
+        "frequencies": frequencies,
+        "posting_offsets": posting_offsets,
+        "postings": postings,
+        "verse_offsets": verse_offsets,
+        "verse_chapter": verse_chapter,
+        "verse_number": verse_number,
+        "verse_juz": verse_juz,
+        "chapter_offsets": chapter_offsets,
+        "texts": texts,
+    }
+
+
+def _save_segment(segment: dict):
+    """
+    Dizini tek bir dosyaya yazar: JSON başlık satırı ve ardından ham diziler.
+    Writes the segment to one file: a JSON header line followed by the raw arrays.
+    """
+    header = {
+        "version": INDEX_VERSION,
+        "edition": segment["edition"],
+        "byteorder": sys.byteorder,
+        "vocab": segment["vocab"],
+        "texts": segment["texts"],
+        "arrays": [[name, segment[name].typecode, len(segment[name])] for name in _ARRAY_FIELDS],
+    }
+
+    def write(f):
+        f.write(json.dumps(header).encode("ascii") + b"\n")
+        for name in _ARRAY_FIELDS:
+            segment[name].tofile(f)
+
+    _atomic_write(_index_path(segment["edition"]), write)
+
+
+def _read_header(f):
+    header = json.loads(f.readline())
+    if header.get("version") != INDEX_VERSION or header.get("byteorder") != sys.byteorder:
+        raise ValueError("Index was written by an incompatible version.")
+    return header
+
+
+def _index_is_valid(edition_key: str):
+    """
+    Dizin dosyasının başlığını ve boyutunu, dizileri okumadan doğrular.
+    Checks the index header and file size without reading the arrays.
+    """
+    path = _index_path(edition_key)
+    try:
+        with open(path, "rb") as f:
+            header = _read_header(f)
+            data_start = f.tell()
+        expected = sum(array(typecode).itemsize * length for _, typecode, length in header["arrays"])
+        return os.path.getsize(path) == data_start + expected
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def _read_segment(edition_key: str):
+    """
+    Dizini diskten okur; dosya yoksa, eskiyse ya da bozuksa None döner.
+    Reads a segment from disk; returns None if it is missing, outdated or corrupt.
+    """
+    if not _index_is_valid(edition_key):
+        return None
+    try:
+        with open(_index_path(edition_key), "rb") as f:
+            header = _read_header(f)
+            segment = {
+                "version": header["version"],
+                "edition": header["edition"],
+                "vocab": header["vocab"],
+                "texts": header["texts"],
+            }
+            for name, typecode, length in header["arrays"]:
+                values = array(typecode)
+                values.fromfile(f, length)
+                segment[name] = values
+    except (OSError, ValueError, KeyError, TypeError, EOFError):
+        return None
+    return segment
+
+
+def _load_segment(edition_key: str):
+    """
+    Sürüm dizinini bellekten, diskten ya da yerel sürüm dosyasından yükler.
+    Loads an edition segment from memory, disk, or the locally stored edition file.
+    """
+    if edition_key in _segments:
+        return _segments[edition_key]
+
+    segment = _read_segment(edition_key)
+    if segment is not None:
+        segment["vocab_ids"] = {w: i for i, w in enumerate(segment["vocab"])}
+        _segments[edition_key] = segment
+        return segment
+
+    verses = _read_edition(edition_key)
+    if verses is None:
+        return None
+    return _index_edition(edition_key, verses)
+
+
+def _index_edition(edition_key: str, verses: list):
+    """
+    Sürümün ayetlerinden dizin oluşturur, diske yazar ve belleğe alır.
+    Builds the segment from an edition's verses, persists and caches it.
+    """
+    segment = _build_segment(edition_key, verses)
+    _save_segment(segment)
+    segment["vocab_ids"] = {w: i for i, w in enumerate(segment["vocab"])}
+    _segments[edition_key] = segment
+    return segment
+
+
+def _get_segment(edition_name: str, script_type: str = ""):
+    edition_key, error = _edition_key(edition_name, script_type)
+    if error:
+        return None, error
+    segment = _load_segment(edition_key)
+    if segment is None:
+        return None, {"error": f"Edition '{edition_key}' is not in the concordance. Call build_quran_concordance first."}
+    return segment, None
+
+
+def _postings_for(segment: dict, word: str):
+    token_id = segment["vocab_ids"].get(normalize_word(word))
+    if token_id is None:
+        return None, array("I")
+    offsets = segment["posting_offsets"]
+    return token_id, segment["postings"][offsets[token_id]:offsets[token_id + 1]]
+
+
+def _locate(segment: dict, offset: int):
+    verse_index = bisect_right(segment["verse_offsets"], offset) - 1
+    return verse_index, offset - segment["verse_offsets"][verse_index]
+
+
+def build_concordance(edition_name: str, script_type: str = "", refresh: bool = False):
+    """
+    Bir sürümü yerel olarak saklar ve yalnızca o sürümün dizinini oluşturur.
+    Stores an edition locally and builds the index for that edition only.
+
+    Diğer sürümlerin dizinlerine dokunulmaz, böylece yeni bir sürüm eklemek
+    tüm konkordansın yeniden oluşturulmasını gerektirmez.
+    Other editions' segments are left untouched, so adding a new edition does
+    not rebuild the whole concordance. An edition that is already indexed is
+    only rebuilt when refresh is set or its local files are missing or corrupt.
+
+    Args / Parametreler:
+        edition_name (str): Sürüm adı (örn: "tr-ates") / Edition name (e.g. "tr-ates")
+        script_type (str, optional): Yazı tipi ("" = normal, "la" = latin, "lad" = latin diakritikli) / Script type ("" = normal, "la" = latin, "lad" = latin with diacritics)
+        refresh (bool, optional): Yerel kopyayı yeniden indir / Re-download the local copy
+
+    Returns / Dönüş:
+        dict: Dizin özeti veya hata mesajı / Index summary or error message
+
+    Örnek / Example:
+        >>> build_concordance("eng-ummmuhammad")
+        {'edition': 'eng-ummmuhammad', 'verses': 6236, 'tokens': 160312, 'vocabulary': 5412}
+    """
+    try:
+        edition_key, error = _edition_key(edition_name, script_type)
+        if error:
+            return error
+        if not _load_verse_juz():
+            return {"error": "Failed to retrieve Quran info for juz data. The edition was not indexed."}
+
+        verses = None if refresh else _read_edition(edition_key)
+        if verses is None:
+            data = get_full_quran(edition_name, script_type)
+            if "error" in data:
+                return data
+            if not isinstance(data.get("quran"), list):
+                return {"error": "Failed to retrieve full Quran. Unexpected response format."}
+            _write_json(_edition_path(edition_key), data)
+            segment = _index_edition(edition_key, data["quran"])
+        else:
+            # Sürüm değişmedi; geçerli dizin varsa yeniden oluşturulmaz
+            # The edition is unchanged, so a valid index is reused as is
+            segment = _load_segment(edition_key)
+
+        return {
+            "edition": edition_key,
+            "verses": len(segment["texts"]),
+            "tokens": len(segment["token_ids"]),
+            "vocabulary": len(segment["vocab"]),
+        }
+    except Exception as e:
+        return {"error": f"Exception occurred: {str(e)}"}
+
+
+def list_concordance_editions():
+    """
+    Yerel olarak saklanan ve dizinlenen sürümleri listeler.
+    Lists the editions stored locally and indexed in the concordance.
+
+    Returns / Dönüş:
+        dict: Sürüm listesi veya hata mesajı / List of editions or error message
+
+    Örnek / Example:
+        >>> list_concordance_editions()
+        {'editions': [{'edition': 'eng-ummmuhammad', 'indexed': True}]}
+    """
+    try:
+        stored = set()
+        if os.path.isdir(EDITIONS_DIR):
+            stored.update(name[:-5] for name in os.listdir(EDITIONS_DIR) if name.endswith(".json"))
+        indexed = set(_segments)
+        if os.path.isdir(INDEX_DIR):
+            indexed.update(
+                name[:-4] for name in os.listdir(INDEX_DIR)
+                if name.endswith(".idx") and _index_is_valid(name[:-4])
+            )
+        return {
+            "editions": [
+                {"edition": key, "indexed": key in indexed}
+                for key in sorted(stored | indexed)
+            ]
+        }
+    except Exception as e:
+        return {"error": f"Exception occurred: {str(e)}"}
+
+
+def get_word_frequency(edition_name: str, word: str, script_type: str = ""):
+    """
+    Bir kelimenin toplam, sure bazında ve cüz bazında geçiş sayılarını getirir.
+    Gets the total, per-surah and per-juz occurrence counts of a word.
+
+    Args / Parametreler:
+        edition_name (str): Sürüm adı / Edition name
+        word (str): Aranan kelime / Word to look up
+        script_type (str, optional): Yazı tipi / Script type
+
+    Returns / Dönüş:
+        dict: Frekans verisi veya hata mesajı / Frequency data or error message
+
+    Örnek / Example:
+        >>> get_word_frequency("eng-ummmuhammad", "mercy")
+        {'word': 'mercy', 'total': 79, 'verses': 74, 'surahs': {2: 9, ...}, 'juzs': {1: 4, ...}}
+    """
+    try:
+        segment, error = _get_segment(edition_name, script_type)
+        if error:
+            return error
+
+        _, postings = _postings_for(segment, word)
+        surahs = Counter()
+        juzs = Counter()
+        verses = set()
+        for offset in postings:
+            verse_index, _ = _locate(segment, offset)
+            verses.add(verse_index)
+            surahs[segment["verse_chapter"][verse_index]] += 1
+            juz = segment["verse_juz"][verse_index]
+            if juz:
+                juzs[juz] += 1
+
+        return {
+            "word": normalize_word(word),
+            "total": len(postings),
+            "verses": len(verses),
+            "surahs": dict(sorted(surahs.items())),
+            "juzs": dict(sorted(juzs.items())),
+        }
+    except Exception as e:
+        return {"error": f"Exception occurred: {str(e)}"}
+
+
+def get_frequency_table(edition_name: str, scope: str = "all", number: int = 0, limit: int = 50, script_type: str = ""):
+    """
+    Tüm Kuran, bir sure veya bir cüz için en sık geçen kelimeleri getirir.
+    Gets the most frequent words for the whole Quran, a surah or a juz.
+
+    Args / Parametreler:
+        edition_name (str): Sürüm adı / Edition name
+        scope (str, optional): Kapsam ("all", "surah", "juz") / Scope ("all", "surah", "juz")
+        number (int, optional): Sure (1-114) veya cüz (1-30) numarası / Surah (1-114) or juz (1-30) number
+        limit (int, optional): Döndürülecek kelime sayısı / Number of words to return
+        script_type (str, optional): Yazı tipi / Script type
+
+    Returns / Dönüş:
+        dict: Frekans tablosu veya hata mesajı / Frequency table or error message
+
+    Örnek / Example:
+        >>> get_frequency_table("eng-ummmuhammad", "surah", 1, 3)
+        {'scope': 'surah', 'number': 1, 'tokens': 29, 'words': [['the', 4], ...]}
+    """
+    try:
+        if limit < 1:
+            return {"error": "Limit must be at least 1."}
+        segment, error = _get_segment(edition_name, script_type)
+        if error:
+            return error
+
+        vocab = segment["vocab"]
+        token_ids = segment["token_ids"]
+        verse_offsets = segment["verse_offsets"]
+
+        if scope == "all":
+            frequencies = segment["frequencies"]
+            top = sorted(range(len(vocab)), key=frequencies.__getitem__, reverse=True)[:limit]
+            return {
+                "scope": scope,
+                "tokens": len(token_ids),
+                "words": [[vocab[i], frequencies[i]] for i in top],
+            }
+
+        counts = Counter()
+        if scope == "surah":
+            if not 1 <= number <= 114:
+                return {"error": "Surah number must be between 1 and 114."}
+            chapter_offsets = segment["chapter_offsets"]
+            counts.update(token_ids[verse_offsets[chapter_offsets[number]]:verse_offsets[chapter_offsets[number + 1]]])
+        elif scope == "juz":
+            if not 1 <= number <= 30:
+                return {"error": "Juz number must be between 1 and 30."}
+            for verse_index, juz in enumerate(segment["verse_juz"]):
+                if juz == number:
+                    counts.update(token_ids[verse_offsets[verse_index]:verse_offsets[verse_index + 1]])
+        else:
+            return {"error": "Scope must be one of 'all', 'surah' or 'juz'."}
+
+        return {
+            "scope": scope,
+            "number": number,
+            "tokens": sum(counts.values()),
+            "words": [[vocab[i], count] for i, count in counts.most_common(limit)],
+        }
+    except Exception as e:
+        return {"error": f"Exception occurred: {str(e)}"}
+
+
+def get_word_occurrences(edition_name: str, word: str, limit: int = 100, script_type: str = ""):
+    """
+    Bir kelimenin geçtiği ayetleri ve ayet içindeki konumlarını getirir.
+    Gets the verses a word occurs in along with its positions within each verse.
+
+    Args / Parametreler:
+        edition_name (str): Sürüm adı / Edition name
+        word (str): Aranan kelime / Word to look up
+        limit (int, optional): Döndürülecek en fazla kayıt / Maximum number of entries
+        script_type (str, optional): Yazı tipi / Script type
+
+    Returns / Dönüş:
+        dict: Geçiş listesi veya hata mesajı / List of occurrences or error message
+
+    Örnek / Example:
+        >>> get_word_occurrences("eng-ummmuhammad", "mercy", 1)
+        {'word': 'mercy', 'total': 79, 'occurrences': [{'chapter': 2, 'verse': 64, 'position': 12}]}
+    """
+    try:
+        if limit < 1:
+            return {"error": "Limit must be at least 1."}
+        segment, error = _get_segment(edition_name, script_type)
+        if error:
+            return error
+
+        _, postings = _postings_for(segment, word)
+        occurrences = []
+        for offset in postings[:limit]:
+            verse_index, position = _locate(segment, offset)
+            occurrences.append({
+                "chapter": segment["verse_chapter"][verse_index],
+                "verse": segment["verse_number"][verse_index],
+                "position": position,
+            })
+        return {"word": normalize_word(word), "total": len(postings), "occurrences": occurrences}
+    except Exception as e:
+        return {"error": f"Exception occurred: {str(e)}"}
+
+
+def get_collocations(edition_name: str, word: str, window: int = 2, limit: int = 20, script_type: str = ""):
+    """
+    Bir kelimenin aynı ayet içinde belirtilen pencere boyunca en sık birlikte geçtiği kelimeleri getirir.
+    Gets the words that most often co-occur with a word within a window in the same verse.
+
+    Args / Parametreler:
+        edition_name (str): Sürüm adı / Edition name
+        word (str): Aranan kelime / Word to look up
+        window (int, optional): Her iki yandaki kelime sayısı / Number of words on each side
+        limit (int, optional): Döndürülecek kelime sayısı / Number of words to return
+        script_type (str, optional): Yazı tipi / Script type
+
+    Returns / Dönüş:
+        dict: Eşdizimler (sayı ve PMI) veya hata mesajı / Collocations (count and PMI) or error message
+
+    PMI, gözlenen sayının pencerelerdeki bağlam konumlarında beklenen sayıya oranının log2 değeridir;
+    bu nedenle farklı pencere boyutlarındaki değerler karşılaştırılabilir.
+    PMI is log2 of the observed count over the count expected in the windows' context slots,
+    so scores from different window sizes are comparable.
+
+    Örnek / Example:
+        >>> get_collocations("eng-ummmuhammad", "mercy", 2, 1)
+        {'word': 'mercy', 'window': 2, 'collocations': [{'word': 'his', 'count': 21, 'pmi': 2.41}]}
+    """
+    try:
+        if window < 1:
+            return {"error": "Window must be at least 1."}
+        if limit < 1:
+            return {"error": "Limit must be at least 1."}
+        segment, error = _get_segment(edition_name, script_type)
+        if error:
+            return error
+
+        token_id, postings = _postings_for(segment, word)
+        token_ids = segment["token_ids"]
+        verse_offsets = segment["verse_offsets"]
+        counts = Counter()
+        for offset in postings:
+            verse_index, _ = _locate(segment, offset)
+            start = max(verse_offsets[verse_index], offset - window)
+            end = min(verse_offsets[verse_index + 1], offset + window + 1)
+            counts.update(token_ids[start:offset])
+            counts.update(token_ids[offset + 1:end])
+
+        # PMI, pencerelerdeki gerçek bağlam konumu sayısına göre normalize edilir
+        # PMI is normalized by the actual number of context slots in the windows
+        total = len(token_ids)
+        slots = sum(counts.values())
+        frequencies = segment["frequencies"]
+        collocations = []
+        for other_id, count in counts.most_common(limit):
+            pmi = math.log2(count * total / (slots * frequencies[other_id]))
+            collocations.append({"word": segment["vocab"][other_id], "count": count, "pmi": round(pmi, 2)})
+
+        return {"word": normalize_word(word), "window": window, "collocations": collocations}
+    except Exception as e:
+        return {"error": f"Exception occurred: {str(e)}"}
+
+
+def get_kwic(edition_name: str, word: str, window: int = 5, limit: int = 50, script_type: str = ""):
+    """
+    Bir kelimeyi bağlamı içinde (KWIC) ayetteki özgün yazımıyla getirir.
+    Gets keyword-in-context (KWIC) lines for a word using the original verse text.
+
+    Args / Parametreler:
+        edition_name (str): Sürüm adı / Edition name
+        word (str): Aranan kelime / Word to look up
+        window (int, optional): Her iki yandaki kelime sayısı / Number of words on each side
+        limit (int, optional): Döndürülecek en fazla satır / Maximum number of lines
+        script_type (str, optional): Yazı tipi / Script type
+
+    Returns / Dönüş:
+        dict: KWIC satırları veya hata mesajı / KWIC lines or error message
+
+    Örnek / Example:
+        >>> get_kwic("eng-ummmuhammad", "mercy", 3, 1)
+        {'word': 'mercy', 'total': 79, 'lines': [{'chapter': 2, 'verse': 64, 'left': '...', 'keyword': 'mercy,', 'right': '...'}]}
+    """
+    try:
+        if window < 1:
+            return {"error": "Window must be at least 1."}
+        if limit < 1:
+            return {"error": "Limit must be at least 1."}
+        segment, error = _get_segment(edition_name, script_type)
+        if error:
+            return error
+
+        _, postings = _postings_for(segment, word)
+        lines = []
+        for offset in postings[:limit]:
+            verse_index, position = _locate(segment, offset)
+            words = _surface_words(segment["texts"][verse_index])
+            lines.append({
+                "chapter": segment["verse_chapter"][verse_index],
+                "verse": segment["verse_number"][verse_index],
+                "left": " ".join(words[max(0, position - window):position]),
+                "keyword": words[position],
+                "right": " ".join(words[position + 1:position + 1 + window]),
+            })
+        return {"word": normalize_word(word), "total": len(postings), "lines": lines}
+    except Exception as e:
+        return {"error": f"Exception occurred: {str(e)}"}
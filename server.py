@@ -14,6 +14,10 @@ from app import (
     get_chapter, get_verse, get_juz, get_ruku, get_page,
     get_manzil, get_maqra, get_quran_info, get_fonts
 )
+from concordance import (
+    build_concordance, list_concordance_editions, get_word_frequency,
+    get_frequency_table, get_word_occurrences, get_collocations, get_kwic
+)
 
 # Initialize MCP server
 mcp = FastMCP("quran-mcp")
@@ -167,5 +171,105 @@ async def get_quran_fonts() -> dict:
     result = get_fonts()
     return result
 
+@mcp.tool()
+async def build_quran_concordance(edition_name: str, script_type: str = "", refresh: bool = False) -> dict:
+    """
+    Bir sürümü yerel olarak saklar ve konkordansa ekler; diğer sürümler yeniden oluşturulmaz.
+    Stores an edition locally and adds it to the concordance without rebuilding other editions.
+
+    Args / Parametreler:
+        edition_name: Sürüm adı / Edition name
+        script_type: Yazı tipi ("" = normal, "la" = latin, "lad" = latin diakritikli) / Script type ("" = normal, "la" = latin, "lad" = latin with diacritics)
+        refresh: Yerel kopyayı yeniden indir / Re-download the local copy
+    """
+    result = build_concordance(edition_name, script_type, refresh)
+    return result
+
+@mcp.tool()
+async def list_quran_concordance_editions() -> dict:
+    """
+    Konkordansta yerel olarak saklanan sürümleri listeler.
+    Lists the editions stored locally for the concordance.
+    """
+    result = list_concordance_editions()
+    return result
+
+@mcp.tool()
+async def get_quran_word_frequency(edition_name: str, word: str, script_type: str = "") -> dict:
+    """
+    Bir kelimenin toplam, sure ve cüz bazında geçiş sayılarını getirir.
+    Gets the total, per-surah and per-juz occurrence counts of a word.
+
+    Args / Parametreler:
+        edition_name: Sürüm adı / Edition name
+        word: Aranan kelime / Word to look up
+        script_type: Yazı tipi ("" = normal, "la" = latin, "lad" = latin diakritikli) / Script type ("" = normal, "la" = latin, "lad" = latin with diacritics)
+    """
+    result = get_word_frequency(edition_name, word, script_type)
+    return result
+
+@mcp.tool()
+async def get_quran_frequency_table(edition_name: str, scope: str = "all", number: int = 0, limit: int = 50, script_type: str = "") -> dict:
+    """
+    Tüm Kuran, bir sure veya bir cüz için en sık geçen kelimeleri getirir.
+    Gets the most frequent words for the whole Quran, a surah or a juz.
+
+    Args / Parametreler:
+        edition_name: Sürüm adı / Edition name
+        scope: Kapsam ("all", "surah", "juz") / Scope ("all", "surah", "juz")
+        number: Sure (1-114) veya cüz (1-30) numarası / Surah (1-114) or juz (1-30) number
+        limit: Döndürülecek kelime sayısı / Number of words to return
+        script_type: Yazı tipi ("" = normal, "la" = latin, "lad" = latin diakritikli) / Script type ("" = normal, "la" = latin, "lad" = latin with diacritics)
+    """
+    result = get_frequency_table(edition_name, scope, number, limit, script_type)
+    return result
+
+@mcp.tool()
+async def get_quran_word_occurrences(edition_name: str, word: str, limit: int = 100, script_type: str = "") -> dict:
+    """
+    Bir kelimenin geçtiği ayetleri ve ayet içindeki konumlarını getirir.
+    Gets the verses a word occurs in along with its positions within each verse.
+
+    Args / Parametreler:
+        edition_name: Sürüm adı / Edition name
+        word: Aranan kelime / Word to look up
+        limit: Döndürülecek en fazla kayıt / Maximum number of entries
+        script_type: Yazı tipi ("" = normal, "la" = latin, "lad" = latin diakritikli) / Script type ("" = normal, "la" = latin, "lad" = latin with diacritics)
+    """
+    result = get_word_occurrences(edition_name, word, limit, script_type)
+    return result
+
+@mcp.tool()
+async def get_quran_collocations(edition_name: str, word: str, window: int = 2, limit: int = 20, script_type: str = "") -> dict:
+    """
+    Bir kelimeyle aynı ayette en sık birlikte geçen kelimeleri getirir.
+    Gets the words that most often co-occur with a word in the same verse.
+
+    Args / Parametreler:
+        edition_name: Sürüm adı / Edition name
+        word: Aranan kelime / Word to look up
+        window: Her iki yandaki kelime sayısı / Number of words on each side
+        limit: Döndürülecek kelime sayısı / Number of words to return
+        script_type: Yazı tipi ("" = normal, "la" = latin, "lad" = latin diakritikli) / Script type ("" = normal, "la" = latin, "lad" = latin with diacritics)
+    """
+    result = get_collocations(edition_name, word, window, limit, script_type)
+    return result
+
+@mcp.tool()
+async def get_quran_kwic(edition_name: str, word: str, window: int = 5, limit: int = 50, script_type: str = "") -> dict:
+    """
+    Bir kelimeyi bağlamı içinde (KWIC) getirir.
+    Gets keyword-in-context (KWIC) lines for a word.
+
+    Args / Parametreler:
+        edition_name: Sürüm adı / Edition name
+        word: Aranan kelime / Word to look up
+        window: Her iki yandaki kelime sayısı / Number of words on each side
+        limit: Döndürülecek en fazla satır / Maximum number of lines
+        script_type: Yazı tipi ("" = normal, "la" = latin, "lad" = latin diakritikli) / Script type ("" = normal, "la" = latin, "lad" = latin with diacritics)
+    """
+    result = get_kwic(edition_name, word, window, limit, script_type)
+    return result
+
 if __name__ == "__main__":
     mcp.run(transport="stdio")
\ No newline at end of file
@@ -0,0 +1,141 @@
+import json
+import os
+
+import pytest
+
+import concordance
+
+EDITION = {"quran": [
+    {"chapter": 2, "verse": 1, "text": "Alif Lam Mim"},
+    {"chapter": 1, "verse": 1, "text": "In the name of Allah, the Merciful, the Most Merciful."},
+    {"chapter": 1, "verse": 2, "text": "Praise be to Allah — Lord of the worlds"},
+    {"chapter": 2, "verse": 2, "text": "This is the Book; Allah's mercy"},
+    {"chapter": 114, "verse": 1, "text": "Say: I seek refuge in the Lord of mankind"},
+    {"chapter": 114, "verse": 2, "text": "The King of mankind"},
+]}
+
+INFO = {"chapters": [
+    {"chapter": 1, "verses": [{"verse": 1, "juz": 1}, {"verse": 2, "juz": 1}]},
+    {"chapter": 2, "verses": [{"verse": 1, "juz": 1}, {"verse": 2, "juz": 2}]},
+    {"chapter": 114, "verses": [{"verse": 1, "juz": 30}, {"verse": 2, "juz": 30}]},
+]}
+
+
+def _no_network(*args, **kwargs):
+    raise AssertionError("network access in tests")
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(concordance, "QURAN_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(concordance, "EDITIONS_DIR", str(tmp_path / "editions"))
+    monkeypatch.setattr(concordance, "INDEX_DIR", str(tmp_path / "index"))
+    monkeypatch.setattr(concordance, "INFO_PATH", str(tmp_path / "info.json"))
+    monkeypatch.setattr(concordance, "_segments", {})
+    monkeypatch.setattr(concordance, "_verse_juz", None)
+    monkeypatch.setattr(concordance, "get_quran_info", _no_network)
+    monkeypatch.setattr(concordance, "get_full_quran", _no_network)
+
+    (tmp_path / "editions").mkdir()
+    (tmp_path / "editions" / "test.json").write_text(json.dumps(EDITION), encoding="utf-8")
+    (tmp_path / "info.json").write_text(json.dumps(INFO), encoding="utf-8")
+    return tmp_path
+
+
+def test_normalize_word_folds_arabic_variants():
+    assert concordance.normalize_word("ٱللَّهِ") == "الله"
+    assert concordance.normalize_word("ٱلرَّحْمَٰنِ") == "الرحمن"
+    assert concordance.normalize_word("رَحْمَةً") == "رحمه"
+    assert concordance.normalize_word("Rahmân,") == "rahman"
+
+
+def test_save_load_round_trip(data_dir):
+    built = concordance.build_concordance("test")
+    assert built == {"edition": "test", "verses": 6, "tokens": 40, "vocabulary": 26}
+
+    original = concordance._segments.pop("test")
+    loaded = concordance._read_segment("test")
+    for name in concordance._ARRAY_FIELDS + ("vocab", "texts"):
+        assert loaded[name] == original[name]
+
+
+def test_build_reuses_valid_index(data_dir, monkeypatch):
+    concordance.build_concordance("test")
+    concordance._segments.clear()
+    monkeypatch.setattr(concordance, "_build_segment", _no_network)
+
+    assert concordance.build_concordance("test")["tokens"] == 40
+
+
+def test_truncated_index_is_rebuilt(data_dir):
+    concordance.build_concordance("test")
+    concordance._segments.clear()
+    index_path = concordance._index_path("test")
+    size = os.path.getsize(index_path)
+    with open(index_path, "r+b") as f:
+        f.truncate(size - 10)
+
+    assert concordance.list_concordance_editions() == {"editions": [{"edition": "test", "indexed": False}]}
+    assert concordance.get_word_frequency("test", "allah")["total"] == 2
+    assert os.path.getsize(index_path) == size
+
+
+def test_corrupt_edition_is_downloaded_again(data_dir, monkeypatch):
+    (data_dir / "editions" / "test.json").write_text('{"quran": [{"chap', encoding="utf-8")
+    assert "error" in concordance.get_word_frequency("test", "allah")
+
+    monkeypatch.setattr(concordance, "get_full_quran", lambda name, script_type="": EDITION)
+    assert concordance.build_concordance("test")["verses"] == 6
+    assert concordance.get_word_frequency("test", "allah")["total"] == 2
+
+
+def test_corrupt_info_is_fetched_again(data_dir, monkeypatch):
+    (data_dir / "info.json").write_text('{"chapters": [', encoding="utf-8")
+    monkeypatch.setattr(concordance, "get_quran_info", lambda: {"error": "down"})
+    assert "error" in concordance.build_concordance("test")
+    assert concordance._verse_juz is None
+
+    monkeypatch.setattr(concordance, "get_quran_info", lambda: INFO)
+    assert concordance.build_concordance("test")["verses"] == 6
+    assert json.loads((data_dir / "info.json").read_text(encoding="utf-8")) == INFO
+
+
+def test_surah_and_juz_scopes(data_dir):
+    surah = concordance.get_frequency_table("test", "surah", 114)
+    assert surah["tokens"] == 13
+    assert surah["words"][:2] == [["the", 2], ["of", 2]]
+
+    juz = concordance.get_frequency_table("test", "juz", 2)
+    assert juz["tokens"] == 6
+    assert concordance.get_frequency_table("test", "juz", 30)["tokens"] == 13
+
+    frequency = concordance.get_word_frequency("test", "mankind")
+    assert frequency["surahs"] == {114: 2}
+    assert frequency["juzs"] == {30: 2}
+
+
+def test_kwic_keyword_matches_surface_words(data_dir):
+    kwic = concordance.get_kwic("test", "the", 2)
+    occurrences = concordance.get_word_occurrences("test", "the")["occurrences"]
+    assert kwic["total"] == len(occurrences) == 7
+
+    texts = {(v["chapter"], v["verse"]): v["text"] for v in EDITION["quran"]}
+    for line, occurrence in zip(kwic["lines"], occurrences):
+        words = concordance._surface_words(texts[(line["chapter"], line["verse"])])
+        position = occurrence["position"]
+        assert line["keyword"] == words[position]
+        assert line["left"] == " ".join(words[max(0, position - 2):position])
+        assert line["right"] == " ".join(words[position + 1:position + 3])
+
+
+def test_limit_and_window_validation(data_dir):
+    assert concordance.get_word_occurrences("test", "the", 0) == {"error": "Limit must be at least 1."}
+    assert concordance.get_frequency_table("test", limit=-1) == {"error": "Limit must be at least 1."}
+    assert concordance.get_kwic("test", "the", window=0) == {"error": "Window must be at least 1."}
+    assert concordance.get_collocations("test", "the", window=-1) == {"error": "Window must be at least 1."}
+    assert concordance.get_collocations("test", "the", limit=0) == {"error": "Limit must be at least 1."}
+
+
+def test_invalid_edition_name(data_dir):
+    assert "Invalid edition name" in concordance.get_word_frequency("../test", "the")["error"]
+    assert "Invalid script type" in concordance.build_concordance("test", "/tmp")["error"]